@@ -7,16 +7,18 @@ A CLI helper for common git operations - commit messages, branch management, sta
 import os
 import sys
 import io
+import shutil
 import subprocess
-import argparse
 import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from collections import Counter
+from typing import List, Dict, Iterator, Optional, Tuple
+from collections import defaultdict
 
-# Fix Unicode output on Windows
-if sys.stdout.encoding != 'utf-8':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Fix Unicode output on Windows (skipped when stdout is already UTF-8)
+if not (sys.stdout.encoding or '').lower().replace('-', '').startswith('utf8'):
+    if hasattr(sys.stdout, 'reconfigure'):  # Python 3.7+
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    else:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 # --- Config ---
 COMMIT_TYPES = {
@@ -32,15 +34,32 @@ COMMIT_TYPES = {
     "ci": "[CI] CI/CD"
 }
 
+# Resolve git once rather than searching PATH on every invocation
+_GIT = shutil.which('git') or 'git'
+
+PROTECTED_BRANCHES = frozenset({'main', 'master', 'develop'})
+# Commands that can create a repository or move HEAD, invalidating lookups
+_HEAD_CHANGING_COMMANDS = frozenset({'init', 'checkout', 'switch'})
+BRANCH_DELETE_BATCH = 200
+
+# Precompiled patterns for the per-line parsing loops
+_SHORTLOG_RE = re.compile(r'\s*(\d+)\s+(.+)')
+
 class GitFlow:
     """Git workflow helper"""
     
-    @staticmethod
-    def run_git(command: List[str], capture_output: bool = True) -> Tuple[bool, str]:
+    # Repository and current-branch lookups, keyed by class, lookup and
+    # repository location for the process lifetime; see clear_cache()
+    _lookup_cache: Dict[Tuple, object] = {}
+    
+    @classmethod
+    def run_git(cls, command: List[str], capture_output: bool = True) -> Tuple[bool, str]:
         """Run git command"""
+        if command[:1] and command[0] in _HEAD_CHANGING_COMMANDS:
+            cls.clear_cache()
         try:
             result = subprocess.run(
-                ['git'] + command,
+                [_GIT] + command,
                 stdout=subprocess.PIPE if capture_output else None,
                 stderr=subprocess.PIPE if capture_output else None,
                 text=True,
@@ -60,53 +79,176 @@ class GitFlow:
             return False, str(e)
     
     @staticmethod
-    def is_git_repo() -> bool:
+    def run_git_bytes(command: List[str]) -> Tuple[bool, bytes]:
+        """Run git command and return raw stdout, skipping text decoding"""
+        try:
+            result = subprocess.run(
+                [_GIT] + command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return True, result.stdout
+            return False, result.stderr
+        except subprocess.TimeoutExpired:
+            return False, b"Command timed out"
+        except FileNotFoundError:
+            return False, b"Git not found. Please install git."
+        except Exception as e:
+            return False, str(e).encode('utf-8', 'replace')
+    
+    @staticmethod
+    def iter_git(command: List[str], timeout: float = 30) -> Iterator[str]:
+        """Stream git command output line by line.
+        
+        Lines are yielded as git produces them, so large outputs are never
+        buffered in full. Raises CalledProcessError if git exits non-zero and
+        TimeoutExpired if it runs longer than timeout seconds.
+        """
+        import tempfile
+        import threading
+        
+        # stderr goes to a file so git never blocks on a full, unread pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                [_GIT] + command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                # git emits UTF-8 by default; never let a stray byte abort
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1
+            )
+            # Killing git on overrun closes stdout, ending the loop below
+            expired = threading.Event()
+            
+            def kill():
+                expired.set()
+                process.kill()
+            
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                for line in process.stdout:
+                    yield line.rstrip('\n')
+            finally:
+                process.stdout.close()
+                returncode = process.wait()
+                timer.cancel()
+            
+            if expired.is_set():
+                raise subprocess.TimeoutExpired([_GIT] + command, timeout)
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', 'replace')
+                raise subprocess.CalledProcessError(returncode, [_GIT] + command, stderr=stderr)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached repository and current-branch lookups.
+        
+        run_git calls this for init, checkout and switch; call it after
+        changing HEAD any other way.
+        """
+        cls._lookup_cache.clear()
+    
+    @classmethod
+    def _cached_lookup(cls, name: str, command: List[str]):
+        """Run a read-only git query once per repository location"""
+        key = (cls, name, _repo_location())
+        if key not in cls._lookup_cache:
+            cls._lookup_cache[key] = cls.run_git(command)
+        return cls._lookup_cache[key]
+    
+    @classmethod
+    def is_git_repo(cls) -> bool:
         """Check if current directory is a git repository"""
-        success, _ = GitFlow.run_git(['rev-parse', '--git-dir'])
+        success, _ = cls._cached_lookup('is_git_repo', ['rev-parse', '--git-dir'])
         return success
     
-    @staticmethod
-    def get_current_branch() -> Optional[str]:
+    @classmethod
+    def get_current_branch(cls) -> Optional[str]:
         """Get current branch name"""
-        success, output = GitFlow.run_git(['branch', '--show-current'])
+        success, output = cls._cached_lookup('current_branch', ['branch', '--show-current'])
         return output if success else None
     
     @staticmethod
-    def get_branches(remote: bool = False) -> List[str]:
-        """Get list of branches"""
-        cmd = ['branch', '-r'] if remote else ['branch']
-        success, output = GitFlow.run_git(cmd)
+    def branch_from_refs(refs: str) -> Optional[str]:
+        """Extract the checked-out branch from a %D ref decoration"""
+        for ref in refs.split(', '):
+            if ref.startswith('HEAD -> '):
+                return ref[len('HEAD -> '):]
+        return None
+    
+    @classmethod
+    def list_branches(cls, remote: bool = False) -> Tuple[List[str], Optional[str]]:
+        """Get list of branches plus the current branch from a single git call"""
+        # %(HEAD) is '*' for the checked-out branch and ' ' otherwise. It goes
+        # last, after a NUL: run_git's strip() may then only drop the final
+        # line's blank marker, which is harmless, whereas leading with it
+        # would let strip() eat the first line's marker and shift its fields
+        success, output = cls.run_git([
+            'for-each-ref', '--format=%(refname)%00%(HEAD)', 'refs/heads/', 'refs/remotes/'
+        ])
         
         if not success:
-            return []
+            return [], None
         
+        prefix = 'refs/remotes/' if remote else 'refs/heads/'
         branches = []
-        for line in output.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('*'):
-                # Remove remote prefix
-                branch = line.replace('origin/', '') if remote else line
-                branches.append(branch)
+        current = None
+        for line in output.splitlines():
+            ref, _, marker = line.partition('\x00')
+            if marker == '*':
+                current = ref[len('refs/heads/'):]
+            if ref.startswith(prefix):
+                if remote:
+                    # Skip symbolic refs like origin/HEAD and remove remote prefix
+                    if ref.endswith('/HEAD'):
+                        continue
+                    branches.append(ref[len(prefix):].replace('origin/', ''))
+                else:
+                    branches.append(ref[len(prefix):])
         
+        return branches, current
+    
+    @classmethod
+    def get_branches(cls, remote: bool = False) -> List[str]:
+        """Get list of branches"""
+        branches, _ = cls.list_branches(remote)
         return branches
     
-    @staticmethod
-    def get_repo_stats() -> Dict:
+    @classmethod
+    def get_repo_stats(cls) -> Dict:
         """Get repository statistics"""
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import date, timedelta
+        
         stats = {}
+        since = (date.today() - timedelta(days=30)).isoformat()
+        
+        # The queries are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            commits_future = executor.submit(cls.run_git, ['rev-list', '--count', 'HEAD'])
+            shortlog_future = executor.submit(cls.run_git, ['shortlog', '-sn', '--all'])
+            files_future = executor.submit(cls.run_git_bytes, ['ls-files', '-z'])
+            recent_future = executor.submit(
+                cls.run_git, ['rev-list', '--count', f'--since={since}', 'HEAD'])
         
         # Total commits
-        success, output = GitFlow.run_git(['rev-list', '--count', 'HEAD'])
+        success, output = commits_future.result()
         stats['total_commits'] = int(output) if success else 0
         
         # Contributors
-        success, output = GitFlow.run_git(['shortlog', '-sn', '--all'])
+        success, output = shortlog_future.result()
         if success:
-            contributors = output.split('\n')
+            contributors = output.splitlines()
             stats['contributors'] = len(contributors)
             stats['top_contributors'] = []
+            match_shortlog = _SHORTLOG_RE.match
             for line in contributors[:5]:
-                match = re.match(r'\s*(\d+)\s+(.+)', line)
+                match = match_shortlog(line)
                 if match:
                     count, name = match.groups()
                     stats['top_contributors'].append((name, int(count)))
@@ -115,107 +257,143 @@ class GitFlow:
             stats['top_contributors'] = []
         
         # Files
-        success, output = GitFlow.run_git(['ls-files'])
-        stats['total_files'] = len(output.split('\n')) if success and output else 0
+        success, output = files_future.result()
+        stats['total_files'] = output.count(b'\x00') if success else 0
         
         # Recent activity (last 30 days)
-        since = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        success, output = GitFlow.run_git(['rev-list', '--count', f'--since={since}', 'HEAD'])
+        success, output = recent_future.result()
         stats['commits_last_30_days'] = int(output) if success else 0
         
         return stats
     
-    @staticmethod
-    def get_commit_log(count: int = 10) -> List[Dict]:
+    @classmethod
+    def get_commit_log(cls, count: int = 10) -> List[Dict]:
         """Get recent commit log"""
-        success, output = GitFlow.run_git([
-            'log',
-            f'-{count}',
-            '--pretty=format:%H|%an|%ae|%ar|%s'
-        ])
-        
-        if not success:
-            return []
-        
         commits = []
-        for line in output.split('\n'):
-            if not line:
-                continue
-            parts = line.split('|')
-            if len(parts) == 5:
-                commits.append({
-                    'hash': parts[0][:7],
-                    'author': parts[1],
-                    'email': parts[2],
-                    'time': parts[3],
-                    'message': parts[4]
-                })
+        try:
+            for line in cls.iter_git([
+                'log',
+                f'-{count}',
+                # Pin %D to short ref names whatever log.decorate says
+                '--decorate=short',
+                '--pretty=format:%h%x1f%an%x1f%ae%x1f%ar%x1f%D%x1f%s'
+            ]):
+                # Fields are split on the ASCII unit separator, which cannot
+                # collide with '|' or other text in names and subjects
+                parts = line.split('\x1f', 5)
+                if len(parts) == 6:
+                    commit_hash, author, email, time, refs, message = parts
+                    commits.append({
+                        'hash': commit_hash,
+                        'author': author,
+                        'email': email,
+                        'time': time,
+                        'refs': refs,
+                        'message': message
+                    })
+        except (subprocess.SubprocessError, OSError):
+            return []
         
         return commits
     
-    @staticmethod
-    def cleanup_branches(dry_run: bool = True) -> List[str]:
+    @classmethod
+    def cleanup_branches(cls, dry_run: bool = True) -> List[str]:
         """Find branches to clean up (merged or old)"""
-        # Get merged branches
-        success, output = GitFlow.run_git(['branch', '--merged'])
+        # Get merged branches (NUL-terminated so names need no unquoting).
+        # lstrip=2 drops refs/heads/ without :short's 'heads/' disambiguation
+        # when a tag shares the branch name
+        success, output = cls.run_git([
+            'for-each-ref', '--merged=HEAD', '--format=%(refname:lstrip=2)%00', 'refs/heads'
+        ])
         if not success:
             return []
         
-        merged_branches = []
-        for line in output.split('\n'):
-            branch = line.strip().lstrip('* ')
-            if branch and branch not in ['main', 'master', 'develop']:
-                merged_branches.append(branch)
+        merged_branches = [
+            branch for branch in (entry.strip('\n') for entry in output.split('\x00'))
+            if branch and branch not in PROTECTED_BRANCHES
+        ]
         
         if not dry_run:
-            for branch in merged_branches:
-                GitFlow.run_git(['branch', '-d', branch])
+            merged_branches, _ = cls.delete_branches(merged_branches)
         
         return merged_branches
     
-    @staticmethod
-    def generate_changelog(since: str = None) -> str:
-        """Generate changelog from commits"""
+    @classmethod
+    def delete_branches(cls, branches: List[str]) -> Tuple[List[str], List[str]]:
+        """Delete local branches, returning (deleted, failed)"""
+        # Delete in batches to stay well under command-line length limits
+        attempted = []
+        for start in range(0, len(branches), BRANCH_DELETE_BATCH):
+            batch = branches[start:start + BRANCH_DELETE_BATCH]
+            success, _ = cls.run_git(['branch', '-d'] + batch)
+            if not success:
+                attempted.extend(batch)
+        
+        if not attempted:
+            return list(branches), []
+        
+        # A failed batch may still have deleted some branches, and git's error
+        # text is localized, so check which branches still exist instead
+        success, output = cls.run_git([
+            'for-each-ref', '--format=%(refname:lstrip=2)%00', 'refs/heads'
+        ])
+        if success:
+            remaining = {entry.strip('\n') for entry in output.split('\x00')}
+        else:
+            remaining = set(attempted)
+        failed = [b for b in attempted if b in remaining]
+        failed_set = set(failed)
+        return [b for b in branches if b not in failed_set], failed
+    
+    @classmethod
+    def generate_changelog(cls, since: str = None, types: Optional[List[str]] = None) -> str:
+        """Generate changelog from commits, optionally limited to some commit types"""
+        from datetime import datetime
+        
         cmd = ['log', '--pretty=format:%s']
         if since:
             cmd.append(f'--since={since}')
-        
-        success, output = GitFlow.run_git(cmd)
-        if not success:
-            return "No commits found"
+        if types:
+            # Let git drop non-matching commits before they reach Python
+            cmd += ['-E', '--grep', '^(' + '|'.join(types) + r')(\([^)]+\))?: ']
         
         # Group by commit type
-        grouped = {key: [] for key in COMMIT_TYPES.keys()}
-        grouped['other'] = []
+        grouped = defaultdict(list)
         
-        for line in output.split('\n'):
-            if not line:
-                continue
-            
-            # Check for conventional commit format
-            match = re.match(r'^(\w+)(?:\([\w-]+\))?: (.+)$', line)
-            if match:
-                commit_type, message = match.groups()
-                if commit_type in grouped:
-                    grouped[commit_type].append(message)
-                else:
+        try:
+            for line in cls.iter_git(cmd):
+                if not line:
+                    continue
+                
+                # Check for conventional commit format: type(scope): message.
+                # The types are a closed set, so a prefix split and dict
+                # lookup is enough - no regex needed.
+                idx = line.find(': ')
+                if idx > 0 and idx + 2 < len(line):
+                    commit_type = line[:idx]
+                    if commit_type.endswith(')') and '(' in commit_type:
+                        commit_type = commit_type[:commit_type.index('(')]
+                    if commit_type in COMMIT_TYPES and (not types or commit_type in types):
+                        grouped[commit_type].append(line[idx + 2:])
+                        continue
+                # --grep also matches body lines, so only keep subjects here
+                if not types:
                     grouped['other'].append(line)
-            else:
-                grouped['other'].append(line)
+        except (subprocess.SubprocessError, OSError):
+            return "No commits found"
         
         # Build changelog
         changelog = []
         changelog.append(f"# Changelog")
-        changelog.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+        changelog.append(f"\nGenerated: {datetime.now().isoformat(sep=' ', timespec='minutes')}\n")
         
         for type_key, type_desc in COMMIT_TYPES.items():
-            commits = grouped[type_key]
-            if commits:
+            if type_key in grouped:
                 changelog.append(f"\n## {type_desc}\n")
-                for commit in commits:
+                for commit in grouped[type_key]:
                     changelog.append(f"- {commit}")
         
-        if grouped['other']:
+        if 'other' in grouped:
             changelog.append(f"\n## Other Changes\n")
             for commit in grouped['other']:
                 changelog.append(f"- {commit}")
@@ -223,6 +401,11 @@ class GitFlow:
         return '\n'.join(changelog)
 
 
+def _repo_location() -> Tuple[str, Optional[str], Optional[str]]:
+    """Identify the repository git would use: working directory plus git env vars"""
+    return os.getcwd(), os.environ.get('GIT_DIR'), os.environ.get('GIT_WORK_TREE')
+
+
 def print_repo_stats(stats: Dict):
     """Pretty print repository statistics"""
     print("\n=== Repository Statistics ===\n")
@@ -248,8 +431,182 @@ def print_commits(commits: List[Dict]):
         print()
 
 
+def _cmd_init(gf: GitFlow, args) -> None:
+    """Initialize a git repository"""
+    success, output = gf.run_git(['init'])
+    if success:
+        print("[OK] Initialized git repository")
+    else:
+        print(f"[X] Failed: {output}")
+
+
+def _cmd_commit(gf: GitFlow, args) -> None:
+    """Create a conventional commit and push it"""
+    # Build commit message
+    scope_part = f"({args.scope})" if args.scope else ""
+    message = f"{args.type}{scope_part}: {args.message}"
+    
+    # Stage all changes
+    print("[...] Staging changes...")
+    success, output = gf.run_git(['add', '-A'])
+    if not success:
+        print(f"[X] Failed to stage: {output}")
+        return
+    
+    # Commit
+    print(f"[...] Committing: {message}")
+    success, output = gf.run_git(['commit', '-m', message])
+    if not success:
+        print(f"[X] Failed to commit: {output}")
+        return
+    
+    print(f"[OK] Committed: {COMMIT_TYPES[args.type]}")
+    
+    # Push (if not disabled)
+    if not args.no_push:
+        print("[...] Pushing to remote...")
+        success, output = gf.run_git(['push'])
+        if success:
+            print("[OK] Pushed to remote")
+        else:
+            print(f"[!] Push failed: {output}")
+            print("[INFO] Run 'git push' manually if needed")
+
+
+def _cmd_log(gf: GitFlow, args) -> None:
+    """Show recent commits"""
+    commits = gf.get_commit_log(args.count)
+    if commits:
+        print_commits(commits)
+    else:
+        print("[INFO] No commits found")
+
+
+def _cmd_stats(gf: GitFlow, args) -> None:
+    """Show repository statistics"""
+    print("[...] Analyzing repository...")
+    stats = gf.get_repo_stats()
+    print_repo_stats(stats)
+
+
+def _cmd_branches(gf: GitFlow, args) -> None:
+    """List branches"""
+    branches, current = gf.list_branches(args.remote)
+    
+    if not branches:
+        print("[INFO] No branches found")
+        return
+    
+    title = "Remote Branches" if args.remote else "Local Branches"
+    print(f"\n=== {title} ===\n")
+    
+    for branch in branches:
+        marker = ">" if branch == current else " "
+        print(f"  {marker} {branch}")
+    
+    print()
+
+
+def _cmd_cleanup(gf: GitFlow, args) -> None:
+    """Clean up merged branches"""
+    if args.dry_run or not args.force:
+        print("[...] Finding merged branches...\n")
+        branches = gf.cleanup_branches(dry_run=True)
+
+        if branches:
+            print("Branches that can be deleted:\n")
+            for branch in branches:
+                print(f"  - {branch}")
+            print(f"\nTotal: {len(branches)} branch(es)")
+
+            if args.dry_run:
+                print("\n[INFO] Run with --force to actually delete")
+        else:
+            print("[OK] No branches to clean up")
+    else:
+        branches = gf.cleanup_branches(dry_run=True)
+        if not branches:
+            print("[OK] No branches to clean up")
+            return
+        
+        deleted, failed = gf.delete_branches(branches)
+        if deleted:
+            print(f"[OK] Deleted {len(deleted)} branch(es)")
+        if failed:
+            print(f"[X] Failed to delete {len(failed)} branch(es):\n")
+            for branch in failed:
+                print(f"  - {branch}")
+
+
+def _cmd_changelog(gf: GitFlow, args) -> None:
+    """Generate a changelog"""
+    from datetime import date, timedelta
+    
+    print("[...] Generating changelog...")
+    
+    # Parse since parameter
+    since_date = None
+    if args.since:
+        if args.since.endswith('.days'):
+            days = int(args.since.replace('.days', ''))
+            since_date = (date.today() - timedelta(days=days)).isoformat()
+        else:
+            since_date = args.since
+    
+    changelog = gf.generate_changelog(since_date, args.types)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(changelog)
+        print(f"[OK] Changelog saved to: {args.output}")
+    else:
+        print(changelog)
+
+
+def _cmd_status(gf: GitFlow, args) -> None:
+    """Show enhanced git status"""
+    # Enhanced status - the last commit's decoration names the branch,
+    # saving a separate lookup unless HEAD is unborn or detached
+    commits = gf.get_commit_log(1)
+    current_branch = gf.branch_from_refs(commits[0]['refs']) if commits else None
+    if current_branch is None:
+        current_branch = gf.get_current_branch()
+    print(f"\n=== On branch: {current_branch} ===\n")
+    
+    # Run git status
+    success, output = gf.run_git(['status', '--short'])
+    if success and output:
+        print("Changes:\n")
+        for line in output.splitlines():
+            print(f"  {line}")
+        print()
+    else:
+        print("[OK] Working tree clean\n")
+    
+    # Show recent commit
+    if commits:
+        commit = commits[0]
+        print(f"Last commit: {commit['hash']} - {commit['message']}")
+        print(f"   {commit['author']} - {commit['time']}\n")
+
+
+_COMMANDS = {
+    'init': _cmd_init,
+    'commit': _cmd_commit,
+    'log': _cmd_log,
+    'stats': _cmd_stats,
+    'branches': _cmd_branches,
+    'cleanup': _cmd_cleanup,
+    'changelog': _cmd_changelog,
+    'status': _cmd_status,
+}
+
+
 def main():
     """Main CLI interface"""
+    # Imported here so library users importing gitflow don't pay for them
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="GitFlow - Smart Git Workflow Assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -294,6 +651,9 @@ Examples:
     changelog_parser = subparsers.add_parser('changelog', help='Generate changelog')
     changelog_parser.add_argument('--since', help='Start date (e.g., 7.days, 2024-01-01)')
     changelog_parser.add_argument('--output', help='Output file (default: stdout)')
+    changelog_parser.add_argument('--type', dest='types', action='append',
+                                  choices=list(COMMIT_TYPES.keys()),
+                                  help='Only include this commit type (repeatable)')
     
     # Status command
     status_parser = subparsers.add_parser('status', help='Enhanced git status')
@@ -316,138 +676,7 @@ Examples:
         return
     
     # Execute command
-    if args.command == 'init':
-        success, output = gf.run_git(['init'])
-        if success:
-            print("[OK] Initialized git repository")
-        else:
-            print(f"[X] Failed: {output}")
-    
-    elif args.command == 'commit':
-        # Build commit message
-        scope_part = f"({args.scope})" if args.scope else ""
-        message = f"{args.type}{scope_part}: {args.message}"
-        
-        # Stage all changes
-        print("[...] Staging changes...")
-        success, output = gf.run_git(['add', '-A'])
-        if not success:
-            print(f"[X] Failed to stage: {output}")
-            return
-        
-        # Commit
-        print(f"[...] Committing: {message}")
-        success, output = gf.run_git(['commit', '-m', message])
-        if not success:
-            print(f"[X] Failed to commit: {output}")
-            return
-        
-        print(f"[OK] Committed: {COMMIT_TYPES[args.type]}")
-        
-        # Push (if not disabled)
-        if not args.no_push:
-            print("[...] Pushing to remote...")
-            success, output = gf.run_git(['push'])
-            if success:
-                print("[OK] Pushed to remote")
-            else:
-                print(f"[!] Push failed: {output}")
-                print("[INFO] Run 'git push' manually if needed")
-    
-    elif args.command == 'log':
-        commits = gf.get_commit_log(args.count)
-        if commits:
-            print_commits(commits)
-        else:
-            print("[INFO] No commits found")
-    
-    elif args.command == 'stats':
-        print("[...] Analyzing repository...")
-        stats = gf.get_repo_stats()
-        print_repo_stats(stats)
-    
-    elif args.command == 'branches':
-        current = gf.get_current_branch()
-        branches = gf.get_branches(args.remote)
-        
-        if not branches:
-            print("[INFO] No branches found")
-            return
-        
-        title = "Remote Branches" if args.remote else "Local Branches"
-        print(f"\n=== {title} ===\n")
-        
-        for branch in branches:
-            marker = ">" if branch == current else " "
-            print(f"  {marker} {branch}")
-        
-        print()
-    
-    elif args.command == 'cleanup':
-        if args.dry_run or not args.force:
-            print("[...] Finding merged branches...\n")
-            branches = gf.cleanup_branches(dry_run=True)
-            
-            if branches:
-                print("Branches that can be deleted:\n")
-                for branch in branches:
-                    print(f"  - {branch}")
-                print(f"\nTotal: {len(branches)} branch(es)")
-                
-                if args.dry_run:
-                    print("\n[INFO] Run with --force to actually delete")
-            else:
-                print("[OK] No branches to clean up")
-        else:
-            branches = gf.cleanup_branches(dry_run=False)
-            if branches:
-                print(f"[OK] Deleted {len(branches)} branch(es)")
-            else:
-                print("[OK] No branches to clean up")
-    
-    elif args.command == 'changelog':
-        print("[...] Generating changelog...")
-        
-        # Parse since parameter
-        since_date = None
-        if args.since:
-            if args.since.endswith('.days'):
-                days = int(args.since.replace('.days', ''))
-                since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            else:
-                since_date = args.since
-        
-        changelog = gf.generate_changelog(since_date)
-        
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(changelog)
-            print(f"[OK] Changelog saved to: {args.output}")
-        else:
-            print(changelog)
-    
-    elif args.command == 'status':
-        # Enhanced status
-        current_branch = gf.get_current_branch()
-        print(f"\n=== On branch: {current_branch} ===\n")
-        
-        # Run git status
-        success, output = gf.run_git(['status', '--short'])
-        if success and output:
-            print("Changes:\n")
-            for line in output.split('\n'):
-                if line:
-                    print(f"  {line}")
-            print()
-        else:
-            print("[OK] Working tree clean\n")
-        
-        # Show recent commit
-        commits = gf.get_commit_log(1)
-        if commits:
-            commit = commits[0]
-            print(f"Last commit: {commit['hash']} - {commit['message']}")
-            print(f"   {commit['author']} - {commit['time']}\n")
+    _COMMANDS[args.command](gf, args)
 
 
 if __name__ == "__main__":